@@ -4,6 +4,7 @@ from time import time
 import numpy as np
 import torch
 from torch import cuda
+from tqdm.auto import tqdm
 
 from .modules.colorization_network import ColorizationNetwork
 
@@ -44,19 +45,6 @@ class BenchmarkResults:
         return "{}:\n{}".format(self.descr, '\n'.join(res))
 
 
-def _display_progress(info, i, i_max):
-    beg = '' if i == 1 else '\r'
-    end = '\n' if i == i_max else ''
-
-    fmt = beg + "{}: {}/{}"
-    msg = fmt.format(info, i, i_max)
-
-    display_width = len(fmt.format(info, i_max, i_max))
-    msg_ljusted = msg.ljust(display_width)
-
-    print(msg_ljusted, end=end, flush=True)
-
-
 def _network_execution_time(network, batch):
     # forward pass
     start = time()
@@ -107,20 +95,14 @@ def benchmark_network(batch_dims=_BATCH_DIMS_DEFAULT,
     dummy_batch = dummy_batch.to(device)
 
     # dry runs
-    for i in range(1, n_dry + 1):
-        if verbose:
-            _display_progress("dry run", i, n_dry)
-
+    for _ in tqdm(range(n_dry), desc="dry run", disable=not verbose):
         _network_execution_time(network, dummy_batch)
 
     # run benchmark
     t_forward = []
     t_backward = []
 
-    for i in range(1, n_stat + 1):
-        if verbose:
-            _display_progress("sample run", i, n_stat)
-
+    for _ in tqdm(range(n_stat), desc="sample run", disable=not verbose):
         t_f, t_b = _network_execution_time(network, dummy_batch)
 
         t_forward.append(t_f)
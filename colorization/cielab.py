@@ -1,6 +1,5 @@
 from functools import partial
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from .util.image import lab_to_rgb
@@ -83,6 +82,8 @@ class CIELAB:
 
     @classmethod
     def _plot_ab_matrix(cls, mat, pixel_borders=False, ax=None, title=None):
+        import matplotlib.pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots()
 
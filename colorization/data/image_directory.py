@@ -2,6 +2,7 @@ import os
 
 import torch
 from torch.utils.data.dataset import Dataset
+from torchvision.io import ImageReadMode, decode_image, read_file
 
 from ..util.image import images_in_directory, imread, to_rgb
 
@@ -9,14 +10,22 @@ from ..util.image import images_in_directory, imread, to_rgb
 class ImageDirectory(Dataset):
     LABEL_FILENAME = 'labels.txt'
 
+    BACKENDS = ['skimage', 'torchvision']
+
     def __init__(self,
                  root,
                  return_labels=True,
                  return_filenames=False,
-                 transform=None):
+                 transform=None,
+                 backend='skimage'):
+
+        if backend not in self.BACKENDS:
+            fmt = "backend must be one of {}"
+            raise ValueError(fmt.format(', '.join(self.BACKENDS)))
 
         self.root = root
         self.transform = transform
+        self.backend = backend
         self.return_labels = return_labels
         self.return_filenames = return_filenames
 
@@ -27,7 +36,7 @@ class ImageDirectory(Dataset):
     def __getitem__(self, index):
         filename = self._files[index]
 
-        img = to_rgb(imread(os.path.join(self.root, filename)))
+        img = self._read(os.path.join(self.root, filename))
 
         if self.transform:
             img = self.transform(img)
@@ -57,6 +66,15 @@ class ImageDirectory(Dataset):
 
         self._root = root
 
+    def _read(self, path):
+        if self.backend == 'torchvision':
+            # decodes JPEGs with libjpeg-turbo
+            img = decode_image(read_file(path), mode=ImageReadMode.RGB)
+
+            return img.permute(1, 2, 0).numpy()
+        else:
+            return to_rgb(imread(path))
+
     def _get_paths(self):
         # build list of image paths
         self._files = images_in_directory(self.root, exclude_root=True)
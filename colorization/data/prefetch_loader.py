@@ -0,0 +1,117 @@
+import queue
+import threading
+
+import torch
+
+
+class _Done:
+    pass
+
+
+class _Failed:
+    def __init__(self, exception):
+        self.exception = exception
+
+
+class PrefetchLoader:
+    """Data loader wrapper that moves batches to a device in the background.
+
+    Iterating over a `PrefetchLoader` yields the same batches as iterating
+    over the wrapped data loader, but with all tensors already moved to
+    `device`. Batches are fetched by a separate thread which stays up to
+    `QUEUE_SIZE` batches ahead of the consumer, so that image decoding and
+    host to device copies overlap with whatever is done with the current
+    batch. If `device` is a GPU, copies are issued on a separate CUDA stream,
+    this is only effective if the wrapped data loader was constructed with
+    `pin_memory` set to `True`.
+
+    """
+
+    QUEUE_SIZE = 2
+    QUEUE_TIMEOUT = 0.1
+
+    def __init__(self, loader, device):
+        self.loader = loader
+        self.device = torch.device(device)
+
+    def __iter__(self):
+        q = queue.Queue(maxsize=self.QUEUE_SIZE)
+        stop = threading.Event()
+
+        thread = threading.Thread(
+            target=self._prefetch, args=(q, stop), daemon=True)
+
+        thread.start()
+
+        try:
+            while True:
+                batch = q.get()
+
+                if isinstance(batch, _Done):
+                    break
+                elif isinstance(batch, _Failed):
+                    raise batch.exception
+
+                yield batch
+        finally:
+            # make the prefetching thread exit in case iteration was aborted
+            stop.set()
+
+            while thread.is_alive():
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+
+                thread.join(self.QUEUE_TIMEOUT)
+
+    def __len__(self):
+        return len(self.loader)
+
+    def _prefetch(self, q, stop):
+        if self.device.type == 'cuda':
+            stream = torch.cuda.Stream(self.device)
+        else:
+            stream = None
+
+        try:
+            for batch in self.loader:
+                if stream is None:
+                    batch = self._to_device(batch)
+                else:
+                    with torch.cuda.stream(stream):
+                        batch = self._to_device(batch)
+
+                    stream.synchronize()
+
+                if not self._put(q, batch, stop):
+                    return
+        except Exception as e:
+            self._put(q, _Failed(e), stop)
+        else:
+            self._put(q, _Done(), stop)
+
+    def _put(self, q, item, stop):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=self.QUEUE_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _to_device(self, batch):
+        if torch.is_tensor(batch):
+            batch_ = batch.to(self.device, non_blocking=True)
+
+            # prevent the caching allocator from reusing this memory for the
+            # next copy while the consumer is still working on it
+            if self.device.type == 'cuda':
+                batch_.record_stream(torch.cuda.default_stream(self.device))
+
+            return batch_
+        elif isinstance(batch, (list, tuple)):
+            return type(batch)(self._to_device(b) for b in batch)
+        else:
+            return batch
@@ -95,7 +95,7 @@ def numpy_to_torch(img):
 def torch_to_numpy(batch):
     assert batch.shape[0] == 1
 
-    return batch[0, :, :, :].cpu().numpy().transpose(1, 2, 0)
+    return batch[0, :, :, :].detach().cpu().numpy().transpose(1, 2, 0)
 
 
 def normalize(img, to):
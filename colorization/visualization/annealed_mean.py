@@ -11,10 +11,11 @@ def annealed_mean_demo(model, image_dir, ts=None, verbose=False):
 
     assert len(ts) % 2 == 1
 
-    # run predictions
-    image_paths = images_in_directory(image_dir)
+    # load images
+    images = [imread(path) for path in images_in_directory(image_dir)]
 
-    _, axes = subplots(len(image_paths), len(ts), use_gridspec=True)
+    # run predictions
+    _, axes = subplots(len(images), len(ts), use_gridspec=True)
 
     for c, t in enumerate(ts):
         if verbose:
@@ -22,8 +23,8 @@ def annealed_mean_demo(model, image_dir, ts=None, verbose=False):
 
         model.network.decode_q.T = t
 
-        for r, path in enumerate(image_paths):
-            axes[r, c].imshow(predict_color(model, imread(path)))
+        for r, img in enumerate(images):
+            axes[r, c].imshow(predict_color(model, img))
 
     # reset temperature parameter
     model.network.decode_q.T = t_orig
@@ -1,40 +1,83 @@
 import os
-from functools import partial
 from itertools import chain
 from operator import itemgetter
 
-import matplotlib.pyplot as plt
 import numpy as np
+import torch
+from tqdm.auto import tqdm
 
 from ..cielab import DEFAULT_CIELAB
 from ..util.image import images_in_directory, imread, rgb_to_lab
-from ..util.progress import display_progress
 from .io import read_classification, read_labels, read_lines
 from .plot import subplot_divider, subplots
 
+try:
+    from numba import njit, prange
+    _numba_available = True
+except ImportError:
+    _numba_available = False
 
-def _raw_accuracy(ab_pred, ab_label, thresh, reweigh_classes=False):
-    if reweigh_classes:
-        # bin ground truth pixels
-        q = DEFAULT_CIELAB.bin_ab(ab_pred)
 
-        # get pixel weights
-        pixel_weights = 1 / DEFAULT_CIELAB.gamut.prior[q]
-        pixel_weights /= pixel_weights.sum()
+_INV_PRIOR = 1 / DEFAULT_CIELAB.gamut.prior
 
-    # find pixels not exceeding threshold distance
-    dist = np.linalg.norm(ab_label - ab_pred, axis=2)
+_AB_CHECK_ATOL = 0.05
 
-    within_thresh = dist <= thresh
-    num_within_thresh = np.count_nonzero(within_thresh)
 
-    if num_within_thresh == 0:
-        return 0
+def _pixel_weights(ab_pred):
+    # bin ground truth pixels
+    q = DEFAULT_CIELAB.bin_ab(ab_pred)
 
-    if reweigh_classes:
-        return (within_thresh * pixel_weights).sum()
+    # get pixel weights
+    pixel_weights = _INV_PRIOR[q]
+    pixel_weights /= pixel_weights.sum()
+
+    return pixel_weights
+
+
+def _raw_accuracies_numpy(ab_pred, ab_label, thresh_squared, pixel_weights):
+    # find pixels not exceeding threshold distances, for all thresholds at
+    # once (comparing squared distances saves us from taking square roots)
+    dist_squared = np.square(ab_label[:, :, 0] - ab_pred[:, :, 0])
+    dist_squared += np.square(ab_label[:, :, 1] - ab_pred[:, :, 1])
+
+    within_thresh = dist_squared <= thresh_squared[:, np.newaxis, np.newaxis]
+
+    if pixel_weights is None:
+        return within_thresh.mean(axis=(1, 2))
     else:
-        return num_within_thresh / np.prod(within_thresh.shape[:2])
+        return (within_thresh * pixel_weights).sum(axis=(1, 2))
+
+
+if _numba_available:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _raw_accuracies_numba(ab_pred,
+                              ab_label,
+                              thresh_squared,
+                              pixel_weights):
+
+        h, w, _ = ab_pred.shape
+
+        # every row accumulates into its own slot to avoid races
+        acc = np.zeros((h, thresh_squared.shape[0]))
+
+        for i in prange(h):
+            for j in range(w):
+                da = ab_label[i, j, 0] - ab_pred[i, j, 0]
+                db = ab_label[i, j, 1] - ab_pred[i, j, 1]
+
+                dist_squared = da * da + db * db
+
+                for k in range(thresh_squared.shape[0]):
+                    if dist_squared <= thresh_squared[k]:
+                        if pixel_weights is None:
+                            acc[i, k] += 1
+                        else:
+                            acc[i, k] += pixel_weights[i, j]
+
+        if pixel_weights is None:
+            return acc.sum(axis=0) / (h * w)
+        else:
+            return acc.sum(axis=0)
 
 
 def _auc(ab_pred,
@@ -45,15 +88,22 @@ def _auc(ab_pred,
          reweigh_classes=False):
 
     thresh = np.arange(thresh_min, thresh_max, thresh_step)
+    thresh_squared = np.square(thresh)
+
+    if reweigh_classes:
+        pixel_weights = _pixel_weights(ab_pred)
+    else:
+        pixel_weights = None
 
-    raw_acc = partial(_raw_accuracy,
-                      ab_pred,
-                      ab_label,
-                      reweigh_classes=reweigh_classes)
+    # compute raw accuracies for all thresholds
+    if _numba_available:
+        raw_accuracies = _raw_accuracies_numba
+    else:
+        raw_accuracies = _raw_accuracies_numpy
 
-    aucs = [raw_acc(t) for t in thresh]
+    raw_acc = raw_accuracies(ab_pred, ab_label, thresh_squared, pixel_weights)
 
-    return sum(aucs) / len(thresh)
+    return raw_acc.mean()
 
 
 def good_vs_bad_demo(images_good_file,
@@ -77,7 +127,7 @@ def good_vs_bad_demo(images_good_file,
                 axes[r, c].set_title(title)
 
     # plot divider
-    plt.tight_layout()
+    fig.tight_layout()
 
     if image_paths_good and image_paths_bad:
         subplot_divider(fig, axes, 'horizontal', len(image_paths_good) - 1)
@@ -156,27 +206,110 @@ def amt_demo(participants,
         fig.suptitle(suptitle, y=-0.1)
 
 
+def _auc_torch(ab_pred,
+               ab_label,
+               ab_to_q,
+               inv_prior,
+               thresh_min=0,
+               thresh_max=151,
+               thresh_step=10,
+               reweigh_classes=False):
+
+    # same as _auc but operates on (2, h, w) tensors on arbitrary devices
+    thresh = torch.arange(thresh_min,
+                          thresh_max,
+                          thresh_step,
+                          dtype=ab_pred.dtype,
+                          device=ab_pred.device)
+
+    thresh_squared = thresh * thresh
+
+    dist_squared = (ab_label - ab_pred).pow(2).sum(dim=0)
+
+    within_thresh = dist_squared <= thresh_squared[:, None, None]
+
+    if reweigh_classes:
+        # bin ground truth pixels (see CIELAB.bin_ab)
+        ab_discrete = ((ab_pred + 110) / DEFAULT_CIELAB.AB_RANGE[2]).long()
+        q = ab_to_q[ab_discrete[0], ab_discrete[1]]
+
+        # get pixel weights
+        pixel_weights = inv_prior[q]
+        pixel_weights /= pixel_weights.sum()
+
+        raw_acc = (within_thresh * pixel_weights).sum(dim=(1, 2))
+    else:
+        raw_acc = within_thresh.type(ab_pred.dtype).mean(dim=(1, 2))
+
+    return raw_acc.mean()
+
+
+def _check_ab(ab, img, atol=_AB_CHECK_ATOL):
+    ab_expected = rgb_to_lab(img)[:, :, 1:]
+    ab_actual = ab.permute(1, 2, 0).cpu().numpy()
+
+    if not np.allclose(ab_actual, ab_expected, rtol=0, atol=atol):
+        err = "device Lab conversion deviates from rgb_to_lab by up to {}"
+        raise ValueError(err.format(np.abs(ab_actual - ab_expected).max()))
+
+
 def raw_accuracy_demo(ground_truth_dir,
                       predict_color_dir,
                       reweigh_classes=False,
-                      verbose=False):
+                      verbose=False,
+                      device=None):
 
     image_paths = images_in_directory(predict_color_dir, exclude_root=True)
 
-    auc_total = 0
+    if device is None:
+        auc_total = 0
+
+        for image_path in tqdm(image_paths,
+                               desc="processing image",
+                               disable=not verbose):
+
+            img_gt = imread(os.path.join(ground_truth_dir, image_path))
+            img_pc = imread(os.path.join(predict_color_dir, image_path))
+
+            auc_total += _auc(rgb_to_lab(img_gt)[:, :, 1:],
+                              rgb_to_lab(img_pc)[:, :, 1:],
+                              reweigh_classes=reweigh_classes)
+
+        return auc_total / len(image_paths)
 
-    for i, image_path in enumerate(image_paths):
-        if verbose:
-            display_progress(i, len(image_paths))
+    # alternatively, convert images to Lab and compute AUCs on the given
+    # device so that only the final result has to be copied back
+    from kornia.color import rgb_to_lab as rgb_to_lab_kornia
+
+    ab_to_q = torch.from_numpy(DEFAULT_CIELAB.ab_to_q).to(device)
+    inv_prior = torch.from_numpy(_INV_PRIOR).to(device)
+
+    auc_total = torch.zeros((), device=device)
+
+    for i, image_path in enumerate(tqdm(image_paths,
+                                        desc="processing image",
+                                        disable=not verbose)):
 
         img_gt = imread(os.path.join(ground_truth_dir, image_path))
         img_pc = imread(os.path.join(predict_color_dir, image_path))
 
-        auc_total += _auc(rgb_to_lab(img_gt)[:, :, 1:],
-                          rgb_to_lab(img_pc)[:, :, 1:],
-                          reweigh_classes=reweigh_classes)
+        rgb = torch.from_numpy(np.stack((img_gt, img_pc))).to(device)
+        rgb = rgb.permute(0, 3, 1, 2).type(torch.float32) / 255
+
+        ab_gt, ab_pc = rgb_to_lab_kornia(rgb)[:, 1:, :, :]
+
+        # make sure kornia agrees with the conversion used everywhere else
+        if i == 0:
+            _check_ab(ab_gt, img_gt)
+            _check_ab(ab_pc, img_pc)
+
+        auc_total += _auc_torch(ab_gt,
+                                ab_pc,
+                                ab_to_q,
+                                inv_prior,
+                                reweigh_classes=reweigh_classes)
 
-    return auc_total / len(image_paths)
+    return auc_total.item() / len(image_paths)
 
 
 def vgg_accuracy_demo(image_dir):
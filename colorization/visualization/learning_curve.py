@@ -10,28 +10,40 @@ def learning_curve_from_log(filename,
                             smoothing_alpha=0.05,
                             ax=None):
 
+    from scipy.signal import lfilter
+
     if ax is None:
         _, ax = subplots(no_ticks=False)
 
     # create loss curve
-    losses = []
-    with open(filename, 'r') as f:
-        for line in f:
-            m = re.search(loss_regex, line)
+    if isinstance(loss_regex, re.Pattern):
+        pattern, flags = loss_regex.pattern, loss_regex.flags & ~re.UNICODE
+    else:
+        pattern, flags = loss_regex, 0
 
-            if m is not None:
-                loss = float(m.group(1))
-                losses.append(loss)
+    if isinstance(pattern, str):
+        pattern = pattern.encode()
 
-    iterations = np.arange(1, len(losses) + 1)
+    loss_pattern = re.compile(pattern, flags)
+
+    with open(filename, 'rb') as f:
+        matches = (loss_pattern.search(line.rstrip(b'\r\n')) for line in f)
 
-    # create smoothed loss curve
-    losses_smoothed = losses[:1]
-    for loss in losses[1:]:
-        loss_smoothed = smoothing_alpha * loss + \
-                        (1 - smoothing_alpha) * losses_smoothed[-1]
+        losses = np.fromiter(
+            (float(match.group(1)) for match in matches if match),
+            dtype=np.float64)
+
+    iterations = np.arange(1, len(losses) + 1)
 
-        losses_smoothed.append(loss_smoothed)
+    # create smoothed loss curve, i.e. an exponential moving average
+    # initialized with the first loss value
+    if len(losses) > 0:
+        losses_smoothed, _ = lfilter([smoothing_alpha],
+                                     [1, smoothing_alpha - 1],
+                                     losses,
+                                     zi=[(1 - smoothing_alpha) * losses[0]])
+    else:
+        losses_smoothed = losses
 
     # plot loss curves
     p = ax.semilogy(iterations, losses, alpha=.5)
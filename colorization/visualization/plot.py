@@ -1,9 +1,19 @@
 from functools import partial
 
-import matplotlib.gridspec as gridspec
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.lines import Line2D
+
+
+_NO_TICKS = dict(
+    axis='both',
+    which='both',
+    bottom=False,
+    top=False,
+    left=False,
+    right=False,
+    labelbottom=False,
+    labeltop=False,
+    labelleft=False,
+    labelright=False)
 
 
 def subplots(r=1,
@@ -13,6 +23,9 @@ def subplots(r=1,
              grid_spacing=0.05,
              no_ticks=True):
 
+    import matplotlib.gridspec as gridspec
+    import matplotlib.pyplot as plt
+
     display_width = (figure_width - (c - 1) * grid_spacing) / c
     figure_height = r * display_width + (r - 1) * grid_spacing
 
@@ -22,11 +35,9 @@ def subplots(r=1,
         gs = gridspec.GridSpec(r, c)
         gs.update(wspace=grid_spacing, hspace=grid_spacing)
 
-        axes = np.empty((r, c), dtype=np.object)
-
-        for r_ in range(r):
-            for c_ in range(c):
-                axes[r_, c_] = plt.subplot(gs[r_ * c + c_])
+        axes = np.array([fig.add_subplot(gs[r_, c_])
+                         for r_ in range(r)
+                         for c_ in range(c)], dtype=object).reshape(r, c)
     else:
         fig, axes = plt.subplots(r, c, figsize=(figure_width, figure_height))
 
@@ -34,33 +45,26 @@ def subplots(r=1,
             axes = axes.reshape(r, c)
 
     if no_ticks:
-        for ax in ([axes] if r == c == 1 else axes.flatten()):
-            ax.tick_params(
-                axis='both',
-                which='both',
-                bottom=False,
-                top=False,
-                left=False,
-                right=False,
-                labelbottom=False,
-                labeltop=False,
-                labelleft=False,
-                labelright=False)
+        for ax in ([axes] if r == c == 1 else axes.flat):
+            ax.tick_params(**_NO_TICKS)
 
     return fig, axes
 
 
-def bbox(fig, ax):
-    r = fig.canvas.get_renderer()
+def bbox(fig, ax, renderer=None):
+    if renderer is None:
+        renderer = fig.canvas.get_renderer()
 
-    return ax.get_tightbbox(r).transformed(fig.transFigure.inverted())
+    return ax.get_tightbbox(renderer).transformed(fig.transFigure.inverted())
 
 
 def subplot_divider(fig, axes, orientation, n, n_next=None):
+    from matplotlib.lines import Line2D
+
     if n_next is None:
         n_next = n + 1
 
-    bbox_ = partial(bbox, fig)
+    bbox_ = partial(bbox, fig, renderer=fig.canvas.get_renderer())
 
     line2d = partial(Line2D,
                      transform=fig.transFigure,
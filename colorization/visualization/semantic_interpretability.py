@@ -1,6 +1,5 @@
 import os
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from ..util.image import imread
@@ -195,7 +194,7 @@ def common_confusions(ground_truth_dir,
     d_name = imagenet_plaintext_labels[d_top[which]]
 
     fmt = r"{} $\longrightarrow$ {}"
-    plt.suptitle(fmt.format(c_name, d_name), fontsize=FONTSIZE)
+    axes[0, 0].figure.suptitle(fmt.format(c_name, d_name), fontsize=FONTSIZE)
 
     axes[0, 0].set_ylabel("Ground\nTruth", fontsize=FONTSIZE)
     axes[1, 0].set_ylabel("Recolored", fontsize=FONTSIZE)